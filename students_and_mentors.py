@@ -1,3 +1,12 @@
+import array
+import sys
+from functools import total_ordering
+
+
+_VALID_GENDERS = frozenset(("М", "Ж"))
+
+
+@total_ordering
 class Student:
     """Student class.
     Can receive grades for homework.
@@ -10,14 +19,21 @@ class Student:
 
     Attributes:
         finished_courses (list): List of completed courses.
-        courses_in_progress (list): List of ongoing courses.
-        grades (dict): Dictionary with grades received for each course.
+        courses_in_progress (set): Set of ongoing courses.
+        grades (dict): Dictionary with grades received for each course
+            (stored as `array.array('B')`). Add grades only through
+            `Reviewer.rate_hw`: changing the dictionary directly does not
+            reset the cached average used by comparisons and __str__.
 
     Methods:
+        from_trusted: Creates a student from pre-validated data.
         rate_lecture: Evaluates lecturer for courses in progress.
 
     """
 
+    __slots__ = ('_name', '_surname', '_gender', 'finished_courses',
+                 'courses_in_progress', 'grades', '_avg_cache', '_avg_dirty')
+
     def __init__(self, name: str, surname: str, gender: str):
         """Initialize a new student instance.
 
@@ -34,15 +50,51 @@ class Student:
         if not isinstance(gender, str):
             raise TypeError(f"Gender must be str, not{type(gender).__name__}")
 
-        if gender.strip().upper() not in ["М", "Ж"]:
+        if gender.strip().upper() not in _VALID_GENDERS:
             raise ValueError(f"Gender must be 'М' or 'Ж'")
 
-        self._name = name.strip().title()
-        self._surname = surname.strip().title()
-        self._gender = gender.strip().upper()
+        self._init_fields(name.strip().title(), surname.strip().title(),
+                          gender.strip().upper())
+
+    @classmethod
+    def from_trusted(cls, name: str, surname: str, gender: str):
+        """Create a student from already validated and normalized data.
+
+        Skips the type and gender checks of __init__, so it must only be used
+        with trusted input (e.g. bulk loading of prepared records).
+
+        Args:
+            name (str): Student's first name.
+            surname (str): Student's last name.
+            gender (str): Student's gender ('М' or 'Ж').
+
+        Returns:
+            Student: New student instance.
+
+        """
+        student = cls.__new__(cls)
+        student._init_fields(name, surname, gender)
+        return student
+
+    def _init_fields(self, name: str, surname: str, gender: str):
+        """Set up instance fields from normalized data.
+
+        Shared by __init__ (after validation) and from_trusted.
+
+        Args:
+            name (str): Student's normalized first name.
+            surname (str): Student's normalized last name.
+            gender (str): Student's normalized gender ('М' or 'Ж').
+
+        """
+        self._name = sys.intern(name)
+        self._surname = sys.intern(surname)
+        self._gender = gender
         self.finished_courses = []
-        self.courses_in_progress = []
+        self.courses_in_progress = set()
         self.grades = {}
+        self._avg_cache = None
+        self._avg_dirty = True
 
     @property
     def name(self) -> str:
@@ -59,13 +111,24 @@ class Student:
         """Get student's gender."""
         return self._gender
 
+    def _avg(self) -> float:
+        """Get student's cached average grade, recomputing it if stale."""
+        if self._avg_dirty:
+            self._avg_cache = avg_grade(self.grades)
+            self._avg_dirty = False
+        return self._avg_cache
+
+    def _key(self) -> float:
+        """Get the value students are compared and sorted by."""
+        return self._avg()
+
     def rate_lecture(self, target_lecturer, course: str, grade: int):
         """Rate lecturer for a specific course.
 
         Args:
             target_lecturer: Lecturer being rated.
             course: Course name.
-            grade: Grade to assign (0-10).
+            grade: Integer grade to assign (0-10).
 
         Returns:
             str: 'Ошибка' if the operation is invalid, None on success.
@@ -74,57 +137,49 @@ class Student:
         if (isinstance(target_lecturer, Lecturer) and
                 course in self.courses_in_progress and
                 course in target_lecturer.courses_attached and
-                0 <= grade <= 10):
-            if course in target_lecturer.grades:
-                target_lecturer.grades[course] += [grade]
-            else:
-                target_lecturer.grades[course] = [grade]
+                isinstance(grade, int) and 0 <= grade <= 10):
+            self._rate_lecture_unchecked(target_lecturer, course, grade)
         else:
             return "Ошибка"
 
+    def _rate_lecture_unchecked(self, target_lecturer, course: str, grade: int):
+        """Rate lecturer without validating the arguments.
+
+        Callers must have already checked that target_lecturer is a Lecturer,
+        that both sides have the course and that the grade is an int in 0-10.
+        Intended for trusted bulk loading and test fixtures.
+
+        Args:
+            target_lecturer (Lecturer): Lecturer being rated.
+            course (str): Course name.
+            grade (int): Grade to assign (0-10).
+
+        """
+        grades = target_lecturer.grades.get(course)
+        if grades is None:
+            grades = target_lecturer.grades[course] = array.array('B')
+        grades.append(grade)
+        target_lecturer._avg_dirty = True
+
     def __str__(self) -> str:
         """Returns student's information."""
         return (f"Имя: {self.name}\n"
                 f"Фамилия: {self.surname}\n"
-                f"Средняя оценка за домашние задания: {avg_grade(self.grades):.2f}\n"
-                f"Курсы в процессе изучения: {', '.join(self.courses_in_progress)}\n"
+                f"Средняя оценка за домашние задания: {self._avg():.2f}\n"
+                f"Курсы в процессе изучения: {', '.join(sorted(self.courses_in_progress))}\n"
                 f"Завершенные курсы: {', '.join(self.finished_courses)}")
 
     def __eq__(self, other) -> bool:
         """Equal: student1 == student2 (by average rating)"""
         if not isinstance(other, Student):
             return NotImplemented
-        return avg_grade(self.grades) == avg_grade(other.grades)
-
-    def __ne__(self, other) -> bool:
-        """Not equal: student1 != student2 (by average rating)"""
-        if not isinstance(other, Student):
-            return NotImplemented
-        return avg_grade(self.grades) != avg_grade(other.grades)
+        return self._key() == other._key()
 
     def __lt__(self, other) -> bool:
         """Less than: student1 < student2 (by average rating)"""
         if not isinstance(other, Student):
             return NotImplemented
-        return avg_grade(self.grades) < avg_grade(other.grades)
-
-    def __le__(self, other) -> bool:
-        """Less than or equal: student1 <= student2 (by average rating)"""
-        if not isinstance(other, Student):
-            return NotImplemented
-        return avg_grade(self.grades) <= avg_grade(other.grades)
-
-    def __gt__(self, other) -> bool:
-        """Greater than: student1 > student2 (by average rating)"""
-        if not isinstance(other, Student):
-            return NotImplemented
-        return avg_grade(self.grades) > avg_grade(other.grades)
-
-    def __ge__(self, other) -> bool:
-        """Greater than or equal: student1 >= student2 (by average rating)"""
-        if not isinstance(other, Student):
-            return NotImplemented
-        return avg_grade(self.grades) >= avg_grade(other.grades)
+        return self._key() < other._key()
 
 
 class Mentor:
@@ -134,10 +189,12 @@ class Mentor:
     Attributes:
         _name (str): The mentor's first name.
         _surname (str): The mentor's last name.
-        courses_attached (list): List of courses the mentor is responsible for.
+        courses_attached (set): Set of courses the mentor is responsible for.
 
     """
 
+    __slots__ = ('_name', '_surname', 'courses_attached')
+
     def __init__(self, name: str, surname: str):
         """Initialize a new mentor instance.
 
@@ -151,9 +208,9 @@ class Mentor:
         if not isinstance(surname, str):
             raise TypeError(f"Surname must be str, not {type(surname).__name__}")
 
-        self._name = name.strip().title()
-        self._surname = surname.strip().title()
-        self.courses_attached = []
+        self._name = sys.intern(name.strip().title())
+        self._surname = sys.intern(surname.strip().title())
+        self.courses_attached = set()
 
     @property
     def name(self) -> str:
@@ -166,10 +223,17 @@ class Mentor:
         return self._surname
 
 
+@total_ordering
 class Lecturer(Mentor):
     """Lecturer class for mentors. Can give lectures and be evaluated by students.
     Inherited from the parent class Mentor.
 
+    Attributes:
+        grades (dict): Dictionary with grades received for each course
+            (stored as `array.array('B')`). Add grades only through
+            `Student.rate_lecture`: changing the dictionary directly does not
+            reset the cached average used by comparisons and __str__.
+
     Notes:
         - This subclass extends the __init__ method from Mentor
           to include additional attributes for Lecturer specifics.
@@ -178,52 +242,43 @@ class Lecturer(Mentor):
 
     """
 
+    __slots__ = ('grades', '_avg_cache', '_avg_dirty')
+
     def __init__(self, name: str, surname: str):
         """Initialize a new lecturer instance."""
         super().__init__(name, surname)
         self.grades = {}
+        self._avg_cache = None
+        self._avg_dirty = True
+
+    def _avg(self) -> float:
+        """Get lecturer's cached average grade, recomputing it if stale."""
+        if self._avg_dirty:
+            self._avg_cache = avg_grade(self.grades)
+            self._avg_dirty = False
+        return self._avg_cache
+
+    def _key(self) -> float:
+        """Get the value lecturers are compared and sorted by."""
+        return self._avg()
 
     def __str__(self) -> str:
         """Returns lecturer's information."""
         return (f"Имя: {self.name}\n"
                 f"Фамилия: {self.surname}\n"
-                f"Средняя оценка за лекции: {avg_grade(self.grades):.2f}")
+                f"Средняя оценка за лекции: {self._avg():.2f}")
 
     def __eq__(self, other) -> bool:
         """Equal: lecturer1 == lecturer2 (by average rating)"""
         if not isinstance(other, Lecturer):
             return NotImplemented
-        return avg_grade(self.grades) == avg_grade(other.grades)
-
-    def __ne__(self, other) -> bool:
-        """Not equal: lecturer1 != lecturer2 (by average rating)"""
-        if not isinstance(other, Lecturer):
-            return NotImplemented
-        return avg_grade(self.grades) != avg_grade(other.grades)
+        return self._key() == other._key()
 
     def __lt__(self, other) -> bool:
         """Less than: lecturer1 < lecturer2 (by average rating)"""
         if not isinstance(other, Lecturer):
             return NotImplemented
-        return avg_grade(self.grades) < avg_grade(other.grades)
-
-    def __le__(self, other) -> bool:
-        """Less than or equal: lecturer1 <= lecturer2 (by average rating)"""
-        if not isinstance(other, Lecturer):
-            return NotImplemented
-        return avg_grade(self.grades) <= avg_grade(other.grades)
-
-    def __gt__(self, other) -> bool:
-        """Greater than: lecturer1 > lecturer2 (by average rating)"""
-        if not isinstance(other, Lecturer):
-            return NotImplemented
-        return avg_grade(self.grades) > avg_grade(other.grades)
-
-    def __ge__(self, other) -> bool:
-        """Greater than or equal: lecturer1 >= lecturer2 (by average rating)"""
-        if not isinstance(other, Lecturer):
-            return NotImplemented
-        return avg_grade(self.grades) >= avg_grade(other.grades)
+        return self._key() < other._key()
 
 
 class Reviewer(Mentor):
@@ -238,6 +293,8 @@ class Reviewer(Mentor):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, name, surname):
         """Initialize a new reviewer instance."""
         super().__init__(name, surname)
@@ -248,7 +305,7 @@ class Reviewer(Mentor):
         Args:
             target_student (Student): Student being rated.
             course (str): Course name.
-            grade (int): Grade to assign (0-10).
+            grade (int): Integer grade to assign (0-10).
 
         Returns:
             str: 'Ошибка' if the operation is invalid, None on success.
@@ -256,20 +313,37 @@ class Reviewer(Mentor):
         Notes:
             - A mentor can rate homework only for students currently taking
               the same course as the mentor.
-            - Grades are stored as lists inside the student's `grades` dictionary.
+            - Grades are stored as `array.array('B')` inside the student's
+              `grades` dictionary, so only integer grades are accepted.
 
         """
         if (isinstance(target_student, Student) and
                 course in self.courses_attached and
                 course in target_student.courses_in_progress and
-                0 <= grade <= 10):
-            if course in target_student.grades:
-                target_student.grades[course] += [grade]
-            else:
-                target_student.grades[course] = [grade]
+                isinstance(grade, int) and 0 <= grade <= 10):
+            self._rate_hw_unchecked(target_student, course, grade)
         else:
             return 'Ошибка'
 
+    def _rate_hw_unchecked(self, target_student, course: str, grade: int):
+        """Rate a student's homework without validating the arguments.
+
+        Callers must have already checked that target_student is a Student,
+        that both sides have the course and that the grade is an int in 0-10.
+        Intended for trusted bulk loading and test fixtures.
+
+        Args:
+            target_student (Student): Student being rated.
+            course (str): Course name.
+            grade (int): Grade to assign (0-10).
+
+        """
+        grades = target_student.grades.get(course)
+        if grades is None:
+            grades = target_student.grades[course] = array.array('B')
+        grades.append(grade)
+        target_student._avg_dirty = True
+
     def __str__(self) -> str:
         """Returns reviewer's information."""
         return (f"Имя: {self.name}\n"
@@ -280,23 +354,46 @@ def avg_grade(course_grades: dict) -> float:
     """Calculate average grade for one person courses.
 
     Args:
-        course_grades (dict): Dictionary with course names as keys and lists of grades as values.
+        course_grades (dict): Dictionary with course names as keys and sequences of grades as values.
 
     Returns:
         float: Average grade across all courses or 0.0 if no grades.
 
     """
-    if not course_grades:
+    total = 0
+    count = 0
+    for grades in course_grades.values():
+        total += sum(grades)
+        count += len(grades)
+
+    if not count:
         return 0.0
 
-    target_rating = []
-    for grades in course_grades.values():
-        target_rating.extend(grades)
+    return total / count
+
+def _course_avg(people: list, course_name: str) -> float:
+    """Calculate average grade for a course across everyone in the list.
+
+    Args:
+        people (list): Students or lecturers with a `grades` dictionary.
+        course_name (str): Course name.
+
+    Returns:
+        float: Average grade for the course or 0.0 if no grades.
 
-    if not target_rating:
+    """
+    total = 0
+    count = 0
+    for person in people:
+        grades = person.grades.get(course_name)
+        if grades:
+            total += sum(grades)
+            count += len(grades)
+
+    if not count:
         return 0.0
 
-    return sum(target_rating) / len(target_rating)
+    return total / count
 
 def avg_students_grade(students_list: list, course_name: str) -> float:
     """Calculate average grade for a particular course among all students.
@@ -309,15 +406,7 @@ def avg_students_grade(students_list: list, course_name: str) -> float:
         float: Average grade for the course across all students or 0.0 if no grades.
 
     """
-    target_rating = []
-    for student in students_list:
-        if course_name in student.grades:
-            target_rating.extend(student.grades[course_name])
-
-    if not target_rating:
-        return 0.0
-
-    return sum(target_rating) / len(target_rating)
+    return _course_avg(students_list, course_name)
 
 def avg_lecturers_grade(lecturers_list: list, course_name: str) -> float:
     """Calculate average grade for a particular course among all lecturers.
@@ -330,15 +419,7 @@ def avg_lecturers_grade(lecturers_list: list, course_name: str) -> float:
         float: Average grade for the course across all students or 0.0 if no grades.
 
     """
-    target_rating = []
-    for lecturer in lecturers_list:
-        if course_name in lecturer.grades:
-            target_rating.extend(lecturer.grades[course_name])
-
-    if not target_rating:
-        return 0.0
-
-    return sum(target_rating) / len(target_rating)
+    return _course_avg(lecturers_list, course_name)
 
 # Testing:
 if __name__ == "__main__":
@@ -347,43 +428,43 @@ if __name__ == "__main__":
     reviewer = Reviewer('Пётр', 'Петров')
     print(isinstance(lecturer, Mentor)) # True
     print(isinstance(reviewer, Mentor)) # True
-    print(lecturer.courses_attached)    # []
-    print(reviewer.courses_attached)    # []
+    print(lecturer.courses_attached)    # set()
+    print(reviewer.courses_attached)    # set()
 
     print("\n\nЗадание № 2. Атрибуты и взаимодействие классов:\n")
     lecturer = Lecturer('Иван', 'Иванов')
     reviewer = Reviewer('Пётр', 'Петров')
     student = Student('Ольга', 'Алёхина', 'Ж')
 
-    student.courses_in_progress += ['Python', 'Java']
-    lecturer.courses_attached += ['Python', 'C++']
-    reviewer.courses_attached += ['Python', 'C++']
+    student.courses_in_progress.update(['Python', 'Java'])
+    lecturer.courses_attached.update(['Python', 'C++'])
+    reviewer.courses_attached.update(['Python', 'C++'])
 
     print(student.rate_lecture(lecturer, 'Python', 7))   # None
     print(student.rate_lecture(lecturer, 'Java', 8))     # Ошибка
     print(student.rate_lecture(lecturer, 'С++', 8))      # Ошибка
     print(student.rate_lecture(reviewer, 'Python', 6))   # Ошибка
 
-    print(lecturer.grades)  # {'Python': [7]}
+    print(lecturer.grades)  # {'Python': array('B', [7])}
 
     print("\n\nЗадание № 3. Полиморфизм и магические методы и Задание № 4. Полевые испытания:\n")
     reviewer1 = Reviewer('Василий', 'Иванов')
-    reviewer1.courses_attached += ['Java', 'Python', 'Git', 'OOP']
+    reviewer1.courses_attached.update(['Java', 'Python', 'Git', 'OOP'])
     reviewer2 = Reviewer('Григорий', 'Волков')
-    reviewer2.courses_attached += ['Python', 'Git', 'OOP']
+    reviewer2.courses_attached.update(['Python', 'Git', 'OOP'])
     lecturer1 = Lecturer('Сергей', 'Петров')
-    lecturer1.courses_attached += ['Python', 'Java', 'OOP']
+    lecturer1.courses_attached.update(['Python', 'Java', 'OOP'])
     lecturer2 = Lecturer('Вера', 'Васильева')
-    lecturer2.courses_attached += ['Git', 'OOP', 'Python']
+    lecturer2.courses_attached.update(['Git', 'OOP', 'Python'])
     student1 = Student('Николай', 'Степанов', 'М')
     student2 = Student('Лидия', 'Зайцева', 'М')
     student1.finished_courses += ['C++', 'Java']
-    student1.courses_in_progress += ['Python', 'Git', 'OOP']
+    student1.courses_in_progress.update(['Python', 'Git', 'OOP'])
     student1.rate_lecture(lecturer1, 'Python', 8)
     student1.rate_lecture(lecturer2, 'Git', 9)
     student1.rate_lecture(lecturer2, 'Python', 9)
     student2.finished_courses += ['Git', 'Java']
-    student2.courses_in_progress += ['Python', 'OOP', 'C++']
+    student2.courses_in_progress.update(['Python', 'OOP', 'C++'])
     student2.rate_lecture(lecturer1, 'Python', 9)
     student2.rate_lecture(lecturer1, 'OOP', 8)
     student2.rate_lecture(lecturer2, 'Python', 8)